@@ -1,6 +1,7 @@
 import sys
 import os
 import argparse
+import logging
 
 # Add src directory to the Python path
 src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), 'src'))
@@ -14,17 +15,17 @@ def main(keywords, search_type, proxies):
     print("Search Type:", search_type)
     print("Proxies:", proxies)
     
-    # Initialize the GitHub crawler
+    urls = []
+    # Initialize the GitHub crawler, its session is closed when the block ends
     try:
-        github_crawler = GitHub_Crawler()
+        with GitHub_Crawler() as github_crawler:
+            # Perform the search
+            try:
+                urls = github_crawler.search(keywords=keywords, type=search_type, proxies=proxies)
+            except Exception as e:
+                print("Error during search:", e)
     except Exception as e:
         print("Error initializing GitHub crawler:", e)
-
-    # Perform the search
-    try:
-        urls = github_crawler.search(keywords=keywords, type=search_type, proxies=proxies)
-    except Exception as e:
-        print("Error during search:", e)
         
     print("Search URLs:", urls)
     
@@ -52,6 +53,9 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
+    # Show the crawler's progress messages
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     # Parse comma-separated inputs
     try:
         keywords = args.keywords.split(",")
@@ -1,24 +1,185 @@
+import asyncio
+import itertools
+import logging
 import random
 import requests
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from email.utils import parsedate_to_datetime
+from urllib.parse import quote_plus, urlencode, urlsplit
 
 from bs4 import BeautifulSoup
 from enum import Enum
-from typing import List
+from typing import IO, Any, Callable, List
 from abc import abstractmethod
 
+# Prefer the C-backed lxml parser, fall back to the built-in one if it's missing
+try:
+    import lxml.html as lxml_html
+    from lxml import etree as lxml_etree
+
+    HTML_PARSER = "lxml"
+    # Compiled once, returns the result link hrefs straight from libxml2
+    SEARCH_HREF_XPATH = lxml_etree.XPath(
+        "//div[contains(concat(' ', normalize-space(@class), ' '), ' search-title ')]"
+        "//a[contains(concat(' ', normalize-space(@class), ' '), ' prc-Link-Link-85e08 ')]"
+        "/@href"
+    )
+except ImportError:
+    lxml_html = None
+    HTML_PARSER = "html.parser"
+
+# Optional C HTML5 parser that builds lxml trees, only used for str/bytes documents,
+# the streamed responses of search() are always parsed by lxml
+try:
+    from html5_parser import parse as html5_parse
+except (ImportError, RuntimeError):  # RuntimeError if its libxml2 differs from lxml's
+    html5_parse = None
+
+logger = logging.getLogger(__name__)
+
+GITHUB_SEARCH_URL = "https://github.com/search"
+# Proxy URL schemes supported by requests, anything else gets the default protocol
+PROXY_SCHEMES = (
+    "http://",
+    "https://",
+    "socks4://",
+    "socks4a://",
+    "socks5://",
+    "socks5h://",
+)
+
+# How often a request waiting for a free host slot checks if it was cancelled, in seconds
+HOST_SLOT_POLL_INTERVAL = 0.05
+
+# Exponential backoff between search retries, in seconds
+RETRY_BACKOFF_BASE = 1.0
+RETRY_BACKOFF_MAX = 30.0
+# HTTP 4xx statuses that can go away on retry or with another proxy
+RECOVERABLE_CLIENT_ERRORS = (407, 408, 429)
+# Upper bound for a server's Retry-After, so one bad header can't stall a search or ban a proxy
+RETRY_AFTER_MAX = 600.0
+# Fetched proxy lists by source URL, reused for a few minutes across ProxyRotator instances
+PROXY_LIST_CACHE: dict[str, tuple[float, List[str]]] = {}
+PROXY_LIST_CACHE_TTL = 300
+
 
-class GitHub_Search_Type(Enum):
+class GitHub_Search_Type(str, Enum):
     """
     An enumeration for the different types of GitHub search.
+    The values are the `type` parameter of GitHub's search URL.
 
     Repositories: Search for repositories.
     Issues: Search for issues.
     Wikis: Search for wikis.
     """
 
-    Repositories = 1
-    Issues = 2
-    Wikis = 3
+    Repositories = "repositories"
+    Issues = "issues"
+    Wikis = "wikis"
+
+
+class RateLimitedError(requests.HTTPError):
+    """
+    An exception raised when the server responds with HTTP 429 Too Many Requests.
+
+    :param retry_after: seconds to wait before retrying, None if the server didn't say.
+    """
+
+    def __init__(self, *args, retry_after: float = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.retry_after = retry_after
+
+
+class RequestCancelledError(requests.RequestException):
+    """
+    An exception raised when a request is given up because another search attempt already succeeded.
+    """
+
+
+class CancellableStream:
+    """
+    A wrapper of a response body stream that stops reading once the request was cancelled.
+
+    :param raw: the raw response body stream.
+    :param cancel_event: the event that is set when the request is cancelled.
+    """
+
+    __slots__ = ("raw", "cancel_event")
+
+    def __init__(self, raw: IO[bytes], cancel_event: threading.Event):
+        self.raw = raw
+        self.cancel_event = cancel_event
+
+    def read(self, size: int = -1) -> bytes:
+        if self.cancel_event.is_set():
+            raise RequestCancelledError("Request cancelled while reading the response.")
+        return self.raw.read(size)
+
+
+def parse_retry_after(value: str) -> float | None:
+    """
+    A function to parse the Retry-After header, given either in seconds or as an HTTP date.
+    The result is capped at RETRY_AFTER_MAX seconds.
+
+    :param value: the Retry-After header value.
+    :return: seconds to wait before retrying, None if the value is missing or invalid.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    # delay-seconds is digits only, so "inf", "nan" or "1e400" are rejected here
+    if value.isascii() and value.isdigit():
+        return min(RETRY_AFTER_MAX, float(int(value)))
+    try:
+        delay = parsedate_to_datetime(value).timestamp() - time.time()
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return min(RETRY_AFTER_MAX, max(0.0, delay))
+
+
+def is_recoverable_error(error: Exception) -> bool:
+    """
+    A function to check if a failed request is worth retrying.
+    Timeouts, connection errors, 5xx and rate limiting are recoverable, other 4xx are not.
+
+    :param error: the exception raised by the request.
+    :return: True if the request can be retried.
+    """
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        status_code = error.response.status_code
+        return status_code >= 500 or status_code in RECOVERABLE_CLIENT_ERRORS
+    return True
+
+
+def get_backoff_delay(failures: int) -> float:
+    """
+    A function to get the exponential backoff delay with jitter before the next retry.
+
+    :param failures: number of failed requests so far.
+    :return: the delay in seconds.
+    """
+    return min(
+        RETRY_BACKOFF_MAX,
+        RETRY_BACKOFF_BASE * 2 ** (failures - 1) * (1 + random.random() * 0.5),
+    )
+
+
+def get_retry_delay(error: Exception, failures: int) -> float:
+    """
+    A function to get the delay before the next retry.
+    Honors the server's Retry-After on rate limiting, otherwise uses exponential backoff with jitter.
+
+    :param error: the exception raised by the last failed request.
+    :param failures: number of failed requests so far.
+    :return: the delay in seconds.
+    """
+    if isinstance(error, RateLimitedError) and error.retry_after is not None:
+        return error.retry_after
+    return get_backoff_delay(failures)
 
 
 class ProxyRotator:
@@ -30,45 +191,62 @@ class ProxyRotator:
     :param get_proxies_retries: number of retries to get the proxies list.
     :param proxies_source: the URL of the proxy list source.
     :param default_proxy_protocol: the default protocol to use for the proxies.
+    :param cooldowns: a dict of proxy to the time it can be used again, can be shared between rotators.
     """
 
+    __slots__ = ("get_proxies_retries", "proxies", "cooldowns", "_cycle")
+
     def __init__(
         self,
         proxies: List[str] = None,
         get_proxies_retries: int = 5,
         proxies_source: str = "https://free-proxy-list.net/",
         default_proxy_protocol: str = "http",
+        cooldowns: dict[str, float] = None,
     ):
         self.get_proxies_retries = get_proxies_retries
+        self.cooldowns = cooldowns if cooldowns is not None else {}
         if not proxies:
             proxies = self.get_proxy_list(proxies_source)
-        self.proxies = proxies[:]
 
-        # Add protocol to proxies if not present
-        self.proxies = [
-            default_proxy_protocol + "://" + proxy if not "://" in proxy else proxy
-            for proxy in self.proxies
-        ]
-        self.queue = []
+        # Add protocol to proxies if not present, kept immutable so callers can't change it
+        self.proxies = tuple(
+            (
+                proxy
+                if proxy.lower().startswith(PROXY_SCHEMES)
+                else f"{default_proxy_protocol}://{proxy}"
+            )
+            for proxy in proxies
+        )
+
+        # Shuffle once, then hand proxies out round-robin
+        shuffled = list(self.proxies)
+        random.shuffle(shuffled)
+        self._cycle = itertools.cycle(shuffled)
 
     @abstractmethod
     def get_proxy_list(self, source: str) -> List[str]:
         """
         A method to get a list of proxies.
+        A successfully fetched list is cached for PROXY_LIST_CACHE_TTL seconds.
 
         :param source: the URL of the proxy list source.
         :return: a list of proxies.
         """
-        print(f"Getting proxies list from {source}...")
+        cached = PROXY_LIST_CACHE.get(source)
+        if cached and time.time() - cached[0] < PROXY_LIST_CACHE_TTL:
+            return cached[1][:]
+
+        logger.info("Getting proxies list from %s...", source)
         retries = self.get_proxies_retries
         proxy_list = []
         for i in range(retries):
             if i > 0:
-                print(f"Retrying to get proxies list... ({i}/{retries})")
+                logger.info("Retrying to get proxies list... (%d/%d)", i, retries)
             try:
                 proxy_response = requests.get(source)
                 if proxy_response.status_code == 200:
-                    soup = BeautifulSoup(proxy_response.text, "html.parser")
+                    soup = BeautifulSoup(proxy_response.text, HTML_PARSER)
                     proxy_table = soup.find(
                         "table", {"class": "table table-striped table-bordered"}
                     )
@@ -84,8 +262,10 @@ class ProxyRotator:
                         )
                     break
                 else:
-                    print(
-                        f"Failed to get proxies list from {source}. Status code: {proxy_response.status_code}"
+                    logger.warning(
+                        "Failed to get proxies list from %s. Status code: %s",
+                        source,
+                        proxy_response.status_code,
                     )
                     continue
             except Exception as err:
@@ -97,18 +277,48 @@ class ProxyRotator:
             port = proxy["port_http"]
             ip_list.append(f"{ip}:{port}")
 
+        if ip_list:
+            PROXY_LIST_CACHE[source] = (time.time(), ip_list[:])
         return ip_list
 
     def get_proxy(self):
         """
-        A method to get a random proxy from the list.
-        If the queue is empty, it will refill it with the proxies list.
-        :return: a random proxy from the list.
+        A method to get the next proxy from the shuffled list.
+        Every proxy is handed out once before any of them is repeated, skipping proxies in cooldown.
+        If all of them are in cooldown, the one that is available the soonest is returned.
+        :return: a proxy from the list.
+        :raise: IndexError if the proxies list is empty.
+        """
+        now = time.time()
+        soonest = None
+        for _ in range(len(self.proxies)):
+            proxy = next(self._cycle)
+            available_at = self.cooldowns.get(proxy, 0)
+            if available_at <= now:
+                return proxy
+            if soonest is None or available_at < self.cooldowns[soonest]:
+                soonest = proxy
+        if soonest is None:
+            raise IndexError("get_proxy from empty proxies list")
+        return soonest
+
+    def set_cooldown(self, proxy: str, seconds: float):
+        """
+        A method to stop handing out a proxy for the given time, e.g. after it got rate limited.
+
+        :param proxy: the proxy to put in cooldown.
+        :param seconds: the cooldown duration in seconds.
+        """
+        self.cooldowns[proxy] = max(self.cooldowns.get(proxy, 0), time.time() + seconds)
+
+    def get_cooldown(self, proxy: str) -> float:
+        """
+        A method to get the remaining cooldown of a proxy.
+
+        :param proxy: the proxy to check.
+        :return: seconds until the proxy can be used again, 0 if it's available.
         """
-        if not self.queue:
-            self.queue = self.proxies[:]
-            random.shuffle(self.queue)  # Shuffle for randomness each round
-        return self.queue.pop()
+        return max(0.0, self.cooldowns.get(proxy, 0) - time.time())
 
 
 class GitHub_Crawler:
@@ -123,62 +333,227 @@ class GitHub_Crawler:
             GitHub_Search_Type.Repositories,
             proxies=["http://proxy1:port", "http://proxy2:port"]
         )
+        crawler.close()
         ```
+
+    :param pool_size: number of connections kept alive per host in the shared session.
+    :param host_concurrency: maximum number of requests to the same host at the same time.
     """
 
+    __slots__ = (
+        "_session",
+        "_host_concurrency",
+        "_host_semaphores",
+        "_host_semaphores_lock",
+        "_proxy_cooldowns",
+    )
+
+    def __init__(self, pool_size: int = 32, host_concurrency: int = 8):
+        # One session for all requests so connections are reused across retries and searches
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        # Requests run in worker threads, possibly from several searches at once
+        self._host_concurrency = host_concurrency
+        self._host_semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._host_semaphores_lock = threading.Lock()
+        # Rate limited proxies, kept across searches
+        self._proxy_cooldowns: dict[str, float] = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """
+        A method to close the underlying HTTP session and its pooled connections.
+        """
+        self._session.close()
+
+    def _get_host_semaphore(self, url: str) -> threading.BoundedSemaphore:
+        """
+        A method to get the semaphore limiting concurrent requests to the URL's host.
+
+        :param url: the URL to make the request to.
+        :return: the semaphore of the host.
+        """
+        host = urlsplit(url).hostname or ""
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            with self._host_semaphores_lock:
+                semaphore = self._host_semaphores.setdefault(
+                    host, threading.BoundedSemaphore(self._host_concurrency)
+                )
+        return semaphore
+
+    def _acquire_host_slot(
+        self,
+        semaphore: threading.BoundedSemaphore,
+        timeout: float | tuple | None,
+        cancel_event: threading.Event,
+    ):
+        """
+        A method to wait for a free request slot of a host, giving up if the request gets cancelled.
+
+        :param semaphore: the semaphore of the host.
+        :param timeout: the request timeout, the connect timeout is used if it's a tuple.
+        :param cancel_event: the event that is set when the request is cancelled, or None.
+        :raise: requests.Timeout if no slot got free in time,
+            RequestCancelledError if the request was cancelled while waiting.
+        """
+        if isinstance(timeout, tuple):
+            timeout = timeout[0]
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = None if cancel_event is None else HOST_SLOT_POLL_INTERVAL
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise requests.Timeout(
+                        f"Timed out waiting for a free request slot after {timeout}s."
+                    )
+                wait = remaining if wait is None else min(wait, remaining)
+            if semaphore.acquire(timeout=wait):
+                break
+            if cancel_event is not None and cancel_event.is_set():
+                raise RequestCancelledError("Request cancelled before it was sent.")
+        if cancel_event is not None and cancel_event.is_set():
+            semaphore.release()
+            raise RequestCancelledError("Request cancelled before it was sent.")
+
     def make_request(
-        self, url: str, headers: dict = {}, proxy: str = None, timeout: int = None
-    ) -> str:
+        self,
+        url: str,
+        headers: dict = {},
+        proxy: str = None,
+        timeout: int = None,
+        parser: Callable[[IO[bytes]], Any] = None,
+        cancel_event: threading.Event = None,
+    ) -> Any:
         """
         A method to make a request to the specified URL with the given headers and proxy.
+        The body is only downloaded after the status was checked, so error pages are never read.
+        At most `host_concurrency` requests to the same host are made at the same time,
+        waiting for a free slot counts towards the timeout.
+        If a parser is given, the response body is streamed into it as it downloads
+        instead of being read into a string first.
+        Once the cancel event is set, the request is not sent anymore, or its response is closed.
+        A request already blocked in connecting or waiting for the response can't be interrupted,
+        it keeps its host slot until it returns or its timeout runs out.
 
         :param url: the URL to make the request to.
         :param headers: the headers to include in the request.
         :param proxy: the proxy to use for the request.
         :param timeout: timeout for the request in seconds.
-        :return: the response from the request.
-        :raise: an exception if the request fails.
+        :param parser: a callable that takes the raw response body stream.
+        :param cancel_event: an event to cancel the request from another thread.
+        :return: the response text, or the parser's result if a parser is given.
+        :raise: RateLimitedError if the server responds with HTTP 429,
+            RequestCancelledError if the request was cancelled, an exception if the request fails.
         """
+        semaphore = self._get_host_semaphore(url)
         try:
-            response = (
-                requests.get(
+            self._acquire_host_slot(semaphore, timeout, cancel_event)
+            try:
+                response = self._session.get(
                     url,
                     headers=headers,
-                    proxies={"http": proxy, "https": proxy},
+                    proxies={"http": proxy, "https": proxy} if proxy else None,
                     timeout=timeout,
+                    stream=True,
                 )
-                if proxy
-                else requests.get(url, headers=headers, timeout=timeout)
-            )
-            response.raise_for_status()
-            return response.text
+                with response:
+                    if cancel_event is not None and cancel_event.is_set():
+                        raise RequestCancelledError(
+                            "Request cancelled, response dropped."
+                        )
+                    if response.status_code == 429:
+                        raise RateLimitedError(
+                            f"429 Too Many Requests for url: {url}",
+                            response=response,
+                            retry_after=parse_retry_after(
+                                response.headers.get("Retry-After")
+                            ),
+                        )
+                    response.raise_for_status()
+                    if parser is None:
+                        return response.text
+                    # Let urllib3 undo gzip/deflate while the parser reads
+                    response.raw.decode_content = True
+                    return parser(
+                        response.raw
+                        if cancel_event is None
+                        else CancellableStream(response.raw, cancel_event)
+                    )
+            finally:
+                semaphore.release()
+        except RequestCancelledError:
+            raise
         except requests.RequestException as e:
-            print(f"Request failed: {e}")
+            if cancel_event is not None and cancel_event.is_set():
+                # Another attempt already won, this failure doesn't matter anymore
+                raise RequestCancelledError(
+                    "Request cancelled, failure dropped."
+                ) from e
+            logger.warning("Request failed: %s", e)
             raise e
 
-    def parse_search_results(self, html: str) -> List[dict]:
+    def parse_search_results(self, html: str | bytes | IO[bytes]) -> List[dict]:
         """
         A method to parse the search results from the HTML response.
+        Text and bytes are parsed with html5-parser if it's installed, streams always with lxml.
 
-        :param html: the HTML response from the search request.
+        :param html: the HTML response from the search request, as text, bytes or a binary stream.
         :return: a list of parsed search results.
         """
         github_base_url = "https://github.com"
 
-        soup = BeautifulSoup(html, "html.parser")
-        all_search_divs = soup.find_all("div", class_="search-title")
-        all_a = []
-        for search_div in all_search_divs:
-            all_a.extend(search_div.find_all("a", class_="prc-Link-Link-85e08"))
-        url_list = (
-            [
-                {"url": github_base_url + a["href"]}
-                for a in all_a
-                if a and "href" in a.attrs and a["href"]
+        if lxml_html is not None:
+            if hasattr(html, "read"):
+                tree = lxml_html.parse(
+                    html, parser=lxml_html.HTMLParser(encoding="utf-8")
+                ).getroot()
+            elif html and html.strip():
+                if html5_parse is not None:
+                    tree = html5_parse(html, treebuilder="lxml")
+                else:
+                    try:
+                        # Parse bytes like the stream, lxml rejects text with an encoding declaration
+                        tree = lxml_html.fromstring(
+                            html.encode("utf-8") if isinstance(html, str) else html,
+                            parser=lxml_html.HTMLParser(encoding="utf-8"),
+                        )
+                    except lxml_etree.ParserError:
+                        # A page of nothing but comments or a doctype has no document
+                        tree = None
+            else:
+                tree = None
+            if tree is None:
+                return []
+            return [
+                {"url": github_base_url + href}
+                for href in SEARCH_HREF_XPATH(tree)
+                if href
             ]
-            if all_a
-            else []
+
+        soup = (
+            BeautifulSoup(html, HTML_PARSER, from_encoding="utf-8")
+            if not isinstance(html, str)
+            else BeautifulSoup(html, HTML_PARSER)
         )
+        url_list = []
+        append = url_list.append
+        for search_div in soup.find_all("div", class_="search-title"):
+            for a in search_div.find_all("a", class_="prc-Link-Link-85e08"):
+                href = a.get("href")
+                if href:
+                    append({"url": github_base_url + href})
         return url_list
 
     def search(
@@ -189,9 +564,11 @@ class GitHub_Crawler:
         headers: dict = None,
         timeout: int = 30,
         retries: int = 5,
+        concurrency: int = 4,
     ) -> List[dict]:
         """
         A method to search GitHub for repositories, issues, or wikis based on keywords.
+        Requests are sent through several proxies at once and the first successful one wins.
 
         :param keywords: a string separeted by spaces or list of strings to search for.
         :param type: the type of search to perform (repositories, issues, wikis).
@@ -199,29 +576,161 @@ class GitHub_Crawler:
         :param headers: additional headers to include in the request.
         :param timeout: timeout for the request in seconds.
         :param retries: number of retries to make the request in case of failure.
+        :param concurrency: number of requests to run through different proxies at the same time,
+            at most one per proxy.
         :return: a list of search results.
         """
-        if isinstance(keywords, str):
-            keywords = keywords.split()
+        tokens = keywords.split() if isinstance(keywords, str) else keywords
+        # Single pass over the keywords, skipping empty ones
+        query = " ".join(filter(None, (str(keyword).strip() for keyword in tokens)))
 
-        keywords = [str(keyword).strip() for keyword in keywords]
-
-        query = "+".join(keywords)
-        url = f"https://github.com/search?q={query}&type={type.name.lower()}"
+        # Escapes characters like "+" or "&" that would otherwise break the query
+        url = f"{GITHUB_SEARCH_URL}?" + urlencode(
+            {"q": query, "type": type.value}, quote_via=quote_plus
+        )
 
-        proxy_rotator = ProxyRotator(proxies) if proxies else ProxyRotator()
+        proxy_rotator = ProxyRotator(proxies, cooldowns=self._proxy_cooldowns)
 
-        results = []
-        for _ in range(retries):
-            proxy = proxy_rotator.get_proxy()
-            print(f"Using proxy: {proxy}")
-            try:
-                print("GET:", url)
-                html_response = self.make_request(url, headers, proxy, timeout)
-                results = self.parse_search_results(html_response)
-                break
-            except Exception as e:
-                print(f"Error fetching data: {e}")
+        results = asyncio.run(
+            self._search_async(
+                url, proxy_rotator, headers, timeout, retries, concurrency
+            )
+        )
 
-        print(f"No urls found in {type.name} search results.") if not results else None
+        if not results:
+            logger.info("No urls found in %s search results.", type.name)
         return results
+
+    async def _fetch(
+        self,
+        executor: ThreadPoolExecutor,
+        url: str,
+        headers: dict,
+        proxy: str,
+        timeout: int,
+        cancel_event: threading.Event,
+        delay: float = 0,
+    ) -> List[dict]:
+        """
+        A coroutine to make a single search request through the given proxy and parse it.
+        The blocking request itself runs in the executor so several can be in flight at once.
+
+        :param executor: the executor to run the request in.
+        :param url: the URL to make the request to.
+        :param headers: the headers to include in the request.
+        :param proxy: the proxy to use for the request.
+        :param timeout: timeout for the request in seconds.
+        :param cancel_event: the event that is set once another attempt succeeded.
+        :param delay: seconds to wait before making the request.
+        :return: a list of parsed search results.
+        """
+        if delay:
+            logger.info("Waiting %.2fs before retrying...", delay)
+            await asyncio.sleep(delay)
+        logger.debug("Using proxy: %s", proxy)
+        logger.debug("GET: %s", url)
+
+        def parse_and_claim(stream: IO[bytes]) -> List[dict]:
+            results = self.parse_search_results(stream)
+            # Cancel the other attempts before this one frees its host slot
+            cancel_event.set()
+            return results
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor,
+            self.make_request,
+            url,
+            headers,
+            proxy,
+            timeout,
+            parse_and_claim,
+            cancel_event,
+        )
+
+    async def _search_async(
+        self,
+        url: str,
+        proxy_rotator: ProxyRotator,
+        headers: dict,
+        timeout: int,
+        retries: int,
+        concurrency: int,
+    ) -> List[dict]:
+        """
+        A coroutine to fan the search request out across proxies.
+        Up to `concurrency` attempts are kept in flight, a failed attempt is replaced
+        with a new one until `retries` attempts were made, and the rest are cancelled
+        as soon as one of them succeeds, including the requests already running in the
+        executor, which stop at their next cancellation check. Replacements are delayed
+        with exponential backoff. On an error that retrying can't fix no new attempts are
+        made, but the ones already in flight are still awaited.
+        A rate limited proxy is put in cooldown for its Retry-After time, so other proxies
+        are tried first and it's only reused once the cooldown is over.
+
+        :param url: the URL to make the request to.
+        :param proxy_rotator: the proxy rotator to take proxies from.
+        :param headers: the headers to include in the request.
+        :param timeout: timeout for the request in seconds.
+        :param retries: total number of attempts to make.
+        :param concurrency: number of attempts to run at the same time.
+        :return: a list of search results of the first successful attempt.
+        """
+        # Never send the same request through one proxy several times at once
+        concurrency = max(1, min(concurrency, len(proxy_rotator.proxies)))
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        cancel_event = threading.Event()
+        pending = set()
+        task_proxies = {}
+        attempts = 0
+        failures = 0
+        delay = 0
+        try:
+            while attempts < retries or pending:
+                while attempts < retries and len(pending) < concurrency:
+                    proxy = proxy_rotator.get_proxy()
+                    task = asyncio.create_task(
+                        self._fetch(
+                            executor,
+                            url,
+                            headers,
+                            proxy,
+                            timeout,
+                            cancel_event,
+                            max(delay, proxy_rotator.get_cooldown(proxy)),
+                        )
+                    )
+                    task_proxies[task] = proxy
+                    pending.add(task)
+                    attempts += 1
+
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    error = task.exception()
+                    if error is None:
+                        return task.result()
+                    if isinstance(error, RequestCancelledError):
+                        continue
+                    logger.warning("Error fetching data: %s", error)
+                    if not is_recoverable_error(error):
+                        # Attempts through other proxies that are in flight may still succeed
+                        logger.warning("Unrecoverable error, stopping retries.")
+                        attempts = retries
+                        continue
+                    failures += 1
+                    delay = get_backoff_delay(failures)
+                    if isinstance(error, RateLimitedError):
+                        proxy_rotator.set_cooldown(
+                            task_proxies[task], get_retry_delay(error, failures)
+                        )
+            return []
+        finally:
+            # Stop the requests already running in the executor, then drop the queued ones.
+            # A worker blocked in session.get only exits once its request returns or times out,
+            # so it may hold its host slot and delay interpreter exit for up to `timeout`.
+            cancel_event.set()
+            for task in pending:
+                task.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
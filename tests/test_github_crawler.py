@@ -6,15 +6,35 @@ src_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
 if src_path not in sys.path:
     sys.path.append(src_path)
 
-from github_crawler import GitHub_Crawler, ProxyRotator, GitHub_Search_Type
+import github_crawler
+from github_crawler import (
+    GitHub_Crawler,
+    ProxyRotator,
+    GitHub_Search_Type,
+    RateLimitedError,
+    parse_retry_after,
+)
+import asyncio
+import itertools
+import logging
 import pytest
+import threading
+import time
 from typing import List
-import json
-from io import StringIO
+import orjson
+from io import BytesIO
 import requests
 from unittest.mock import MagicMock
 
 
+@pytest.fixture(autouse=True)
+def clear_proxy_list_cache(monkeypatch):
+    """
+    A fixture to give each test an empty proxies list cache.
+    """
+    monkeypatch.setattr(github_crawler, "PROXY_LIST_CACHE", {})
+
+
 def get_test_html_code(empty_html: bool = False) -> str:
     """
     A method to get the HTML code for testing.
@@ -39,15 +59,39 @@ def get_urls_list(empty_urls: bool = False) -> str:
     :return: a JSON string of URLs.
     """
     if not empty_urls:
-        with open("props/test_urls.json") as file:
-            json_string = json.dumps(json.loads(file.read()))
+        with open("props/test_urls.json", "rb") as file:
+            json_string = orjson.dumps(orjson.loads(file.read())).decode()
     else:
-        json_string = json.dumps([])
+        json_string = orjson.dumps([]).decode()
     return json_string
 
 
+def get_mock_response(html: str, parser=None):
+    """
+    A method to mimic make_request for the given HTML, streaming it into the parser if one is given.
+
+    :param html: the HTML code of the response.
+    :param parser: the parser passed to make_request.
+    :return: the HTML code, or the parser's result if a parser is given.
+    """
+    if parser is None:
+        return html
+    return parser(BytesIO(html.encode("utf-8")))
+
+
 # Test cases for GitHub_Crawler class
-class Test_GitHub_Crawler(GitHub_Crawler):
+class Test_GitHub_Crawler:
+    @pytest.fixture(autouse=True)
+    def crawler(self):
+        """
+        A fixture to create a crawler for each test and close it afterwards.
+
+        :return: the GitHub_Crawler instance.
+        """
+        self.crawler = GitHub_Crawler()
+        yield self.crawler
+        self.crawler.close()
+
     @pytest.mark.skip(
         "Skipping make_request test as it requires network access and there is nothing to test except that."
     )
@@ -69,7 +113,7 @@ class Test_GitHub_Crawler(GitHub_Crawler):
         :raise: an exception if the request fails.
         """
         try:
-            return super().make_request(url, headers, proxy, timeout)
+            return self.crawler.make_request(url, headers, proxy, timeout)
         except Exception as e:
             raise e
 
@@ -93,13 +137,77 @@ class Test_GitHub_Crawler(GitHub_Crawler):
         else:
             html = get_test_html_code(empty_html=True)
 
-        url_list = self.parse_search_results(html)
+        url_list = self.crawler.parse_search_results(html)
 
         assert (
-            json.dumps(url_list) == expected_list
+            orjson.dumps(url_list).decode() == expected_list
         ), f"Expected {expected_list}, but got {url_list}"
 
 
+    @pytest.mark.parametrize("empty_html", [False, True])
+    def test_parse_search_results_without_lxml(self, monkeypatch, empty_html: bool):
+        """
+        Test that the parse_search_results method falls back to BeautifulSoup when lxml is not available.
+
+        :param monkeypatch: pytest fixture to mock methods.
+        :param empty_html: whether to parse the HTML file without results.
+        :return: None
+        :raise: an assertion error if the parsed URLs differ from the lxml ones.
+        """
+        html = get_test_html_code(empty_html=empty_html)
+        expected_url_list = self.crawler.parse_search_results(html)
+
+        monkeypatch.setattr(github_crawler, "lxml_html", None)
+        monkeypatch.setattr(github_crawler, "HTML_PARSER", "html.parser")
+
+        assert self.crawler.parse_search_results(html) == expected_url_list
+
+    def test_parse_search_results_html5_parser(self, monkeypatch):
+        """
+        Test that the parse_search_results method builds the tree with html5-parser when it's available.
+
+        :param monkeypatch: pytest fixture to mock methods.
+        :return: None
+        :raise: an assertion error if html5-parser is not used or the parsed URLs differ.
+        """
+        html = get_test_html_code(empty_html=False)
+        parse_calls = []
+
+        def mock_html5_parse(html, treebuilder):
+            parse_calls.append(treebuilder)
+            return github_crawler.lxml_html.fromstring(html)
+
+        monkeypatch.setattr(github_crawler, "html5_parse", mock_html5_parse)
+
+        url_list = self.crawler.parse_search_results(html)
+
+        assert url_list == orjson.loads(get_urls_list(empty_urls=False))
+        assert parse_calls == ["lxml"]
+
+    @pytest.mark.parametrize(
+        "html",
+        [
+            get_test_html_code(empty_html=False),
+            get_test_html_code(empty_html=True),
+            "<!-- x -->",
+            "<!DOCTYPE html>",
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            + get_test_html_code(empty_html=False),
+        ],
+    )
+    def test_parse_search_results_stream(self, html: str):
+        """
+        Test that the parse_search_results method parses a binary stream the same way as text.
+
+        :param html: the HTML response to parse.
+        :return: None
+        :raise: an assertion error if the parsed URLs differ.
+        """
+
+        assert self.crawler.parse_search_results(
+            BytesIO(html.encode("utf-8"))
+        ) == self.crawler.parse_search_results(html)
+
     @pytest.mark.parametrize(
         "keywords_param, type_param, proxies_param, expect_empty_results",
         [
@@ -132,6 +240,7 @@ class Test_GitHub_Crawler(GitHub_Crawler):
     def test_search(
         self,
         monkeypatch,
+        caplog,
         keywords_param,
         type_param,
         proxies_param,
@@ -141,6 +250,7 @@ class Test_GitHub_Crawler(GitHub_Crawler):
         Test the search method of the GitHub_Crawler class with various parameters.
 
         :param monkeypatch: pytest fixture to mock methods.
+        :param caplog: pytest fixture to capture log messages.
         :param keywords_param: keywords to search for.
         :param type_param: type of search (Repositories, Issues, Wikis).
         :param proxies_param: list of proxies to use.
@@ -150,14 +260,16 @@ class Test_GitHub_Crawler(GitHub_Crawler):
         """
         if expect_empty_results:
             mock_html_content = get_test_html_code(empty_html=True)
-            expected_api_results = json.loads(get_urls_list(empty_urls=True))
+            expected_api_results = orjson.loads(get_urls_list(empty_urls=True))
         else:
             mock_html_content = get_test_html_code(empty_html=False)
-            expected_api_results = json.loads(get_urls_list(empty_urls=False))
+            expected_api_results = orjson.loads(get_urls_list(empty_urls=False))
 
         mock_make_request_calls = []
 
-        def mock_make_request(instance, url, headers, proxy, timeout):
+        def mock_make_request(
+            instance, url, headers, proxy, timeout, parser=None, cancel_event=None
+        ):
             mock_make_request_calls.append(
                 {"url": url, "proxy": proxy, "headers": headers, "timeout": timeout}
             )
@@ -169,8 +281,8 @@ class Test_GitHub_Crawler(GitHub_Crawler):
             )
             query_part = "+".join(temp_keywords_list)
             assert query_part in url
-            assert f"type={type_param.name.lower()}" in url
-            return mock_html_content
+            assert f"type={type_param.value}" in url
+            return get_mock_response(mock_html_content, parser)
 
         monkeypatch.setattr(GitHub_Crawler, "make_request", mock_make_request)
 
@@ -188,26 +300,27 @@ class Test_GitHub_Crawler(GitHub_Crawler):
             get_proxies_retries=5,
             proxies_source="https://free-proxy-list.net/",
             default_proxy_protocol="http",
+            cooldowns=None,
         ):
             pr_instance.get_proxies_retries = get_proxies_retries  # Store retries
+            pr_instance.cooldowns = cooldowns if cooldowns is not None else {}
             if not proxies:  # If proxies argument to ProxyRotator is None or empty
                 # This simulates fetching from source
                 actual_proxies_to_use = mocked_proxies_from_source
             else:
                 actual_proxies_to_use = proxies
 
-            pr_instance.proxies = [
+            pr_instance.proxies = tuple(
                 default_proxy_protocol + "://" + p if "://" not in p else p
                 for p in actual_proxies_to_use
-            ]
-            pr_instance.queue = []  # Initialize queue
+            )
+            pr_instance._cycle = itertools.cycle(pr_instance.proxies)
 
         monkeypatch.setattr(ProxyRotator, "__init__", mocked_proxy_rotator_init)
 
-        old_stdout = sys.stdout
-        sys.stdout = captured_output = StringIO()
+        caplog.set_level(logging.INFO, logger=github_crawler.__name__)
 
-        actual_api_results = self.search(
+        actual_api_results = self.crawler.search(
             keywords=keywords_param,
             type=type_param,
             proxies=proxies_param,
@@ -216,8 +329,7 @@ class Test_GitHub_Crawler(GitHub_Crawler):
             retries=2,  # Test with a couple of retries
         )
 
-        sys.stdout = old_stdout
-        output_text = captured_output.getvalue()
+        output_text = caplog.text
 
         assert actual_api_results == expected_api_results
         assert len(mock_make_request_calls) >= 1  # Should attempt at least once
@@ -241,7 +353,7 @@ class Test_GitHub_Crawler(GitHub_Crawler):
         if expect_empty_results:
             assert f"No urls found in {type_param.name} search results." in output_text
         else:
-            # Check that the "No urls found" message is NOT printed if results are expected
+            # Check that the "No urls found" message is NOT logged if results are expected
             assert (
                 f"No urls found in {type_param.name} search results." not in output_text
             )
@@ -249,6 +361,541 @@ class Test_GitHub_Crawler(GitHub_Crawler):
         # Restore original ProxyRotator.__init__
         monkeypatch.setattr(ProxyRotator, "__init__", original_proxy_rotator_init)
 
+    @pytest.mark.parametrize(
+        "keywords_param, expected_url",
+        [
+            (
+                "c++  a&b",
+                "https://github.com/search?q=c%2B%2B+a%26b&type=repositories",
+            ),
+            (
+                [" dropbox ", "box"],
+                "https://github.com/search?q=dropbox+box&type=repositories",
+            ),
+            (
+                ["dropbox", " ", "", "box"],
+                "https://github.com/search?q=dropbox+box&type=repositories",
+            ),
+        ],
+    )
+    def test_search_url_encoding(self, monkeypatch, keywords_param, expected_url):
+        """
+        Test that the search method escapes the keywords in the search URL.
+
+        :param monkeypatch: pytest fixture to mock methods.
+        :param keywords_param: keywords to search for.
+        :param expected_url: the expected search URL.
+        :return: None
+        :raise: an assertion error if the search URL is not built correctly.
+        """
+        requested_urls = []
+
+        def mock_make_request(
+            instance, url, headers, proxy, timeout, parser=None, cancel_event=None
+        ):
+            requested_urls.append(url)
+            return get_mock_response(get_test_html_code(empty_html=True), parser)
+
+        monkeypatch.setattr(GitHub_Crawler, "make_request", mock_make_request)
+
+        self.crawler.search(
+            keywords=keywords_param,
+            type=GitHub_Search_Type.Repositories,
+            proxies=["http://1.1.1.1:8080"],
+            retries=1,
+        )
+
+        assert requested_urls == [expected_url]
+
+    def test_search_concurrent_proxies(self, monkeypatch):
+        """
+        Test that the search method tries several proxies at once and returns the first successful result.
+
+        :param monkeypatch: pytest fixture to mock methods.
+        :return: None
+        :raise: an assertion error if a failing proxy prevents the search from succeeding.
+        """
+        mock_html_content = get_test_html_code(empty_html=False)
+        expected_api_results = orjson.loads(get_urls_list(empty_urls=False))
+        bad_proxy = "http://1.1.1.1:8080"
+        good_proxy = "http://2.2.2.2:8080"
+        used_proxies = []
+        bad_proxy_tried = threading.Event()
+
+        def mock_make_request(
+            instance, url, headers, proxy, timeout, parser=None, cancel_event=None
+        ):
+            used_proxies.append(proxy)
+            if proxy == bad_proxy:
+                bad_proxy_tried.set()
+                raise requests.ConnectionError("Proxy is down")
+            # Only answer once the other request is in flight too
+            assert bad_proxy_tried.wait(timeout=5)
+            return get_mock_response(mock_html_content, parser)
+
+        monkeypatch.setattr(GitHub_Crawler, "make_request", mock_make_request)
+
+        actual_api_results = self.crawler.search(
+            keywords="dropbox box",
+            type=GitHub_Search_Type.Wikis,
+            proxies=[bad_proxy, good_proxy],
+            retries=2,
+            concurrency=2,
+        )
+
+        assert actual_api_results == expected_api_results
+        assert sorted(used_proxies) == [bad_proxy, good_proxy]
+
+    def test_search_cancels_losing_requests(self, monkeypatch):
+        """
+        Test that the requests of the losing attempts are not sent after the search returned.
+
+        :param monkeypatch: pytest fixture to mock methods.
+        :return: None
+        :raise: an assertion error if a request is started after the search finished.
+        """
+        crawler = GitHub_Crawler(host_concurrency=1)
+        html = get_test_html_code(empty_html=False).encode("utf-8")
+        request_starts = []
+
+        def mock_session_get(session, url, **kwargs):
+            request_starts.append(time.monotonic())
+            time.sleep(0.2)
+            return MagicMock(status_code=200, raw=BytesIO(html))
+
+        monkeypatch.setattr(requests.Session, "get", mock_session_get)
+
+        actual_api_results = crawler.search(
+            keywords="dropbox box",
+            type=GitHub_Search_Type.Wikis,
+            proxies=[
+                "http://1.1.1.1:8080",
+                "http://2.2.2.2:8080",
+                "http://3.3.3.3:8080",
+            ],
+            retries=3,
+            concurrency=3,
+        )
+        search_end = time.monotonic()
+        # Give leftover workers the chance to send their requests
+        time.sleep(0.5)
+        crawler.close()
+
+        assert actual_api_results == orjson.loads(get_urls_list(empty_urls=False))
+        assert len(request_starts) == 1
+        assert all(start < search_end for start in request_starts)
+
+    def test_search_leftover_request_failure_not_logged(self, monkeypatch, caplog):
+        """
+        Test that a losing request failing after the search returned doesn't log a failure.
+
+        :param monkeypatch: pytest fixture to mock methods.
+        :param caplog: pytest fixture to capture log messages.
+        :return: None
+        :raise: an assertion error if the leftover failure is logged as a request failure.
+        """
+        html = get_test_html_code(empty_html=False).encode("utf-8")
+        slow_proxy = "http://1.1.1.1:8080"
+        search_done = threading.Event()
+        slow_request_failed = threading.Event()
+
+        def mock_session_get(session, url, proxies=None, **kwargs):
+            if proxies["https"] == slow_proxy:
+                # Still connecting when the other attempt wins
+                search_done.wait(timeout=5)
+                slow_request_failed.set()
+                raise requests.ConnectTimeout("Connection timed out")
+            return MagicMock(status_code=200, raw=BytesIO(html))
+
+        monkeypatch.setattr(requests.Session, "get", mock_session_get)
+
+        with caplog.at_level(logging.WARNING):
+            actual_api_results = self.crawler.search(
+                keywords="dropbox box",
+                type=GitHub_Search_Type.Wikis,
+                proxies=[slow_proxy, "http://2.2.2.2:8080"],
+                retries=2,
+                concurrency=2,
+            )
+            search_done.set()
+            assert slow_request_failed.wait(timeout=5)
+            # Let the leftover worker finish handling its failure
+            time.sleep(0.1)
+
+        assert actual_api_results == orjson.loads(get_urls_list(empty_urls=False))
+        assert not any(
+            record.getMessage().startswith("Request failed")
+            for record in caplog.records
+        )
+
+    def test_search_concurrency_limited_by_proxies(self, monkeypatch):
+        """
+        Test that the search method runs at most one attempt per proxy at the same time.
+
+        :param monkeypatch: pytest fixture to mock methods.
+        :return: None
+        :raise: an assertion error if a proxy gets several requests at once.
+        """
+        lock = threading.Lock()
+        active = []
+        max_active = []
+
+        def mock_make_request(
+            instance, url, headers, proxy, timeout, parser=None, cancel_event=None
+        ):
+            with lock:
+                active.append(proxy)
+                max_active.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.remove(proxy)
+            raise requests.ConnectionError("Proxy is down")
+
+        monkeypatch.setattr(GitHub_Crawler, "make_request", mock_make_request)
+        monkeypatch.setattr(github_crawler, "RETRY_BACKOFF_BASE", 0)
+
+        actual_api_results = self.crawler.search(
+            keywords="dropbox box",
+            type=GitHub_Search_Type.Wikis,
+            proxies=["http://1.1.1.1:8080"],
+            retries=3,
+            concurrency=4,
+        )
+
+        assert actual_api_results == []
+        assert max_active == [1, 1, 1]
+
+    def test_make_request_rate_limited(self, monkeypatch):
+        """
+        Test that the make_request method raises RateLimitedError with the Retry-After delay on HTTP 429.
+
+        :param monkeypatch: pytest fixture to mock methods.
+        :return: None
+        :raise: an assertion error if the rate limit is not reported correctly.
+        """
+        mock_response = MagicMock(status_code=429, headers={"Retry-After": "7"})
+        monkeypatch.setattr(
+            requests.Session, "get", MagicMock(return_value=mock_response)
+        )
+
+        with pytest.raises(RateLimitedError) as exc_info:
+            self.crawler.make_request("https://github.com/search?q=test&type=wikis")
+
+        assert exc_info.value.retry_after == 7.0
+        assert exc_info.value.response is mock_response
+
+    def test_make_request_stream_parser(self, monkeypatch):
+        """
+        Test that the make_request method streams the response body into the given parser.
+
+        :param monkeypatch: pytest fixture to mock methods.
+        :return: None
+        :raise: an assertion error if the body is not parsed from the stream.
+        """
+        html = get_test_html_code(empty_html=False)
+        mock_response = MagicMock(status_code=200, raw=BytesIO(html.encode("utf-8")))
+        mock_session_get = MagicMock(return_value=mock_response)
+        monkeypatch.setattr(requests.Session, "get", mock_session_get)
+
+        url_list = self.crawler.make_request(
+            "https://github.com/search?q=test&type=wikis",
+            parser=self.crawler.parse_search_results,
+        )
+
+        assert url_list == orjson.loads(get_urls_list(empty_urls=False))
+        assert mock_session_get.call_args.kwargs["stream"] is True
+
+    def test_make_request_error_status(self, monkeypatch):
+        """
+        Test that the make_request method raises on an error status without reading the response body.
+
+        :param monkeypatch: pytest fixture to mock methods.
+        :return: None
+        :raise: an assertion error if the body of the error response is parsed.
+        """
+        mock_response = MagicMock(status_code=503)
+        mock_response.raise_for_status.side_effect = requests.HTTPError(
+            "503 Server Error", response=mock_response
+        )
+        mock_session_get = MagicMock(return_value=mock_response)
+        monkeypatch.setattr(requests.Session, "get", mock_session_get)
+        mock_parser = MagicMock()
+
+        with pytest.raises(requests.HTTPError):
+            self.crawler.make_request(
+                "https://github.com/search?q=test&type=wikis", parser=mock_parser
+            )
+
+        assert mock_session_get.call_args.kwargs["stream"] is True
+        assert not mock_parser.called
+
+    def test_make_request_host_slot_timeout(self, monkeypatch):
+        """
+        Test that the make_request method gives up waiting for a busy host slot after the timeout.
+
+        :param monkeypatch: pytest fixture to mock methods.
+        :return: None
+        :raise: an assertion error if the request waits past its timeout.
+        """
+        crawler = GitHub_Crawler(host_concurrency=1)
+        unblock = threading.Event()
+        calls = []
+
+        def mock_session_get(session, url, **kwargs):
+            calls.append(url)
+            unblock.wait(timeout=5)
+            return MagicMock(status_code=200, text="")
+
+        monkeypatch.setattr(requests.Session, "get", mock_session_get)
+
+        blocking_thread = threading.Thread(
+            target=crawler.make_request, args=("https://github.com/search?q=1",)
+        )
+        blocking_thread.start()
+        while not calls:
+            time.sleep(0.01)
+
+        start = time.monotonic()
+        with pytest.raises(requests.Timeout):
+            crawler.make_request("https://github.com/search?q=2", timeout=0.2)
+        elapsed = time.monotonic() - start
+
+        unblock.set()
+        blocking_thread.join()
+        crawler.close()
+
+        assert 0.2 <= elapsed < 1
+        assert calls == ["https://github.com/search?q=1"]
+
+    @pytest.mark.parametrize(
+        "error, expected_delays",
+        [
+            (requests.ConnectionError("Proxy is down"), [(1.0, 1.5)]),
+            (RateLimitedError("Rate limited", retry_after=7.0), [(6.5, 7.0)]),
+        ],
+    )
+    def test_search_retry_backoff(self, monkeypatch, error, expected_delays):
+        """
+        Test that the search method waits before retrying, honoring Retry-After when rate limited.
+
+        :param monkeypatch: pytest fixture to mock methods.
+        :param error: the error raised by the first request.
+        :param expected_delays: expected (min, max) ranges of the delays before each retry.
+        :return: None
+        :raise: an assertion error if the delays don't match.
+        """
+        mock_html_content = get_test_html_code(empty_html=False)
+        errors = [error]
+        delays = []
+
+        def mock_make_request(
+            instance, url, headers, proxy, timeout, parser=None, cancel_event=None
+        ):
+            if errors:
+                raise errors.pop()
+            return get_mock_response(mock_html_content, parser)
+
+        async def mock_sleep(delay):
+            delays.append(delay)
+
+        monkeypatch.setattr(GitHub_Crawler, "make_request", mock_make_request)
+        monkeypatch.setattr(asyncio, "sleep", mock_sleep)
+
+        actual_api_results = self.crawler.search(
+            keywords="dropbox box",
+            type=GitHub_Search_Type.Wikis,
+            proxies=["http://1.1.1.1:8080"],
+            retries=2,
+            concurrency=1,
+        )
+
+        assert actual_api_results == orjson.loads(get_urls_list(empty_urls=False))
+        assert len(delays) == len(expected_delays)
+        for delay, (min_delay, max_delay) in zip(delays, expected_delays):
+            assert min_delay <= delay <= max_delay
+
+    def test_search_unrecoverable_error_keeps_pending_attempts(self, monkeypatch):
+        """
+        Test that an unrecoverable error from one proxy doesn't drop the attempts still in flight.
+
+        :param monkeypatch: pytest fixture to mock methods.
+        :return: None
+        :raise: an assertion error if the healthy proxy's result is thrown away.
+        """
+        mock_html_content = get_test_html_code(empty_html=False)
+        bad_proxy = "http://1.1.1.1:8080"
+        good_proxy = "http://2.2.2.2:8080"
+        bad_proxy_failed = threading.Event()
+
+        def mock_make_request(
+            instance, url, headers, proxy, timeout, parser=None, cancel_event=None
+        ):
+            if proxy == bad_proxy:
+                bad_proxy_failed.set()
+                raise requests.HTTPError(
+                    "403 Forbidden", response=MagicMock(status_code=403)
+                )
+            # Answer after the other proxy already failed
+            assert bad_proxy_failed.wait(timeout=5)
+            time.sleep(0.1)
+            return get_mock_response(mock_html_content, parser)
+
+        monkeypatch.setattr(GitHub_Crawler, "make_request", mock_make_request)
+
+        actual_api_results = self.crawler.search(
+            keywords="dropbox box",
+            type=GitHub_Search_Type.Wikis,
+            proxies=[bad_proxy, good_proxy],
+            retries=5,
+            concurrency=2,
+        )
+
+        assert actual_api_results == orjson.loads(get_urls_list(empty_urls=False))
+
+    def test_search_rate_limited_proxy_cooldown(self, monkeypatch):
+        """
+        Test that the search method moves on to another proxy when one gets rate limited.
+
+        :param monkeypatch: pytest fixture to mock methods.
+        :return: None
+        :raise: an assertion error if the rate limited proxy is reused during its cooldown.
+        """
+        mock_html_content = get_test_html_code(empty_html=False)
+        used_proxies = []
+
+        def mock_make_request(
+            instance, url, headers, proxy, timeout, parser=None, cancel_event=None
+        ):
+            used_proxies.append(proxy)
+            if len(used_proxies) == 1:
+                raise RateLimitedError("Rate limited", retry_after=60.0)
+            return get_mock_response(mock_html_content, parser)
+
+        async def mock_sleep(delay):
+            pass
+
+        monkeypatch.setattr(GitHub_Crawler, "make_request", mock_make_request)
+        monkeypatch.setattr(asyncio, "sleep", mock_sleep)
+
+        actual_api_results = self.crawler.search(
+            keywords="dropbox box",
+            type=GitHub_Search_Type.Wikis,
+            proxies=["http://1.1.1.1:8080", "http://2.2.2.2:8080"],
+            retries=2,
+            concurrency=1,
+        )
+
+        assert actual_api_results == orjson.loads(get_urls_list(empty_urls=False))
+        assert len(used_proxies) == 2 and used_proxies[0] != used_proxies[1]
+
+        # The cooldown outlives the search, so the next searches skip the proxy too
+        for _ in range(3):
+            self.crawler.search(
+                keywords="dropbox box",
+                type=GitHub_Search_Type.Wikis,
+                proxies=["http://1.1.1.1:8080", "http://2.2.2.2:8080"],
+                retries=1,
+            )
+        assert used_proxies[2:] == [used_proxies[1]] * 3
+
+    def test_make_request_host_concurrency(self, monkeypatch):
+        """
+        Test that the make_request method limits the number of concurrent requests to the same host.
+
+        :param monkeypatch: pytest fixture to mock methods.
+        :return: None
+        :raise: an assertion error if more requests than allowed run at the same time.
+        """
+        crawler = GitHub_Crawler(host_concurrency=2)
+        lock = threading.Lock()
+        active = []
+        max_active = []
+
+        def mock_session_get(session, url, **kwargs):
+            with lock:
+                active.append(url)
+                max_active.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.remove(url)
+            return MagicMock(status_code=200, text="")
+
+        monkeypatch.setattr(requests.Session, "get", mock_session_get)
+
+        threads = [
+            threading.Thread(
+                target=crawler.make_request,
+                args=(f"https://github.com/search?q={i}&type=wikis",),
+            )
+            for i in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        crawler.close()
+
+        assert len(max_active) == 6
+        assert max(max_active) == 2
+
+    def test_search_unrecoverable_error(self, monkeypatch):
+        """
+        Test that the search method stops retrying on a client error that won't go away.
+
+        :param monkeypatch: pytest fixture to mock methods.
+        :return: None
+        :raise: an assertion error if the search keeps retrying.
+        """
+        calls = []
+
+        def mock_make_request(
+            instance, url, headers, proxy, timeout, parser=None, cancel_event=None
+        ):
+            calls.append(proxy)
+            raise requests.HTTPError(
+                "404 Not Found", response=MagicMock(status_code=404)
+            )
+
+        monkeypatch.setattr(GitHub_Crawler, "make_request", mock_make_request)
+
+        actual_api_results = self.crawler.search(
+            keywords="dropbox box",
+            type=GitHub_Search_Type.Wikis,
+            proxies=["http://1.1.1.1:8080"],
+            retries=5,
+            concurrency=1,
+        )
+
+        assert actual_api_results == []
+        assert len(calls) == 1
+
+
+@pytest.mark.parametrize(
+    "value, expected_delay",
+    [
+        ("7", 7.0),
+        (" 120 ", 120.0),
+        ("999999", 600.0),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0),
+        ("Fri, 31 Dec 9999 23:59:59 GMT", 600.0),
+        ("inf", None),
+        ("1e400", None),
+        ("nan", None),
+        ("-5", None),
+        ("soon", None),
+        (None, None),
+    ],
+)
+def test_parse_retry_after(value: str, expected_delay: float):
+    """
+    Test that the parse_retry_after function only accepts delay-seconds or HTTP dates and caps the delay.
+
+    :param value: the Retry-After header value.
+    :param expected_delay: the expected delay in seconds.
+    :raise: an assertion error if the header is parsed incorrectly.
+    """
+    assert parse_retry_after(value) == expected_delay
+
 
 # Test cases for ProxyRotator class
 @pytest.mark.parametrize(
@@ -266,27 +913,68 @@ def test_proxy_rotator_get_proxy(proxies: List[str]):
     ), "ProxyRotator.get_proxy() returned wrong proxy"
 
 
-def test_proxy_rotator_queue_refill():
+@pytest.mark.parametrize(
+    "proxy, expected_proxy",
+    [
+        ("1.1.1.1:8080", "http://1.1.1.1:8080"),
+        ("https://1.1.1.1:443", "https://1.1.1.1:443"),
+        ("socks5://1.1.1.1:1080", "socks5://1.1.1.1:1080"),
+        ("socks4a://1.1.1.1:1080", "socks4a://1.1.1.1:1080"),
+        ("HTTP://2.2.2.2:80", "HTTP://2.2.2.2:80"),
+    ],
+)
+def test_proxy_rotator_default_protocol(proxy: str, expected_proxy: str):
+    """
+    Test that the ProxyRotator class adds the default protocol only to proxies without a known scheme.
+
+    :param proxy: the proxy to pass to the rotator.
+    :param expected_proxy: the expected proxy with protocol.
+    :raise: an assertion error if the protocol is not added correctly.
+    """
+    rotator = ProxyRotator(proxies=[proxy])
+    assert rotator.proxies == (expected_proxy,)
+
+
+def test_proxy_rotator_round_robin():
+    """
+    Test that the get_proxy method of the ProxyRotator class hands out every proxy before repeating.
+
+    :raise: an assertion error if the proxies are not rotated correctly.
+    """
+    proxies = ["http://1.1.1.1:8080", "http://2.2.2.2:8080", "http://3.3.3.3:8080"]
+    rotator = ProxyRotator(proxies)
+
+    first_round = [rotator.get_proxy() for _ in proxies]
+    second_round = [rotator.get_proxy() for _ in proxies]
+
+    assert sorted(first_round) == proxies
+    assert second_round == first_round
+
+
+def test_proxy_rotator_cooldown():
     """
-    Test the queue refill functionality of the ProxyRotator class.
+    Test that the get_proxy method of the ProxyRotator class skips proxies in cooldown.
 
-    :raise: an assertion error if the queue is not refilled correctly.
+    :raise: an assertion error if a proxy in cooldown is handed out while others are available.
     """
     proxies = ["http://1.1.1.1:8080", "http://2.2.2.2:8080"]
     rotator = ProxyRotator(proxies)
 
-    # Empty the queue manually
-    rotator.queue = []
+    rotator.set_cooldown(proxies[0], 60)
+    assert [rotator.get_proxy() for _ in range(4)] == [proxies[1]] * 4
 
-    proxy = rotator.get_proxy()
-    assert proxy in proxies, f"Expected proxy from list, got: {proxy}"
+    # Once all of them are in cooldown, the one available first is used
+    rotator.set_cooldown(proxies[1], 120)
+    assert rotator.get_proxy() == proxies[0]
+    assert 0 < rotator.get_cooldown(proxies[0]) <= 60
 
 
-def test_proxy_rotator_get_proxy_list_retries_and_status_error(monkeypatch):
+def test_proxy_rotator_get_proxy_list_retries_and_status_error(monkeypatch, caplog):
     """
     Test the get_proxy_list method of the ProxyRotator class when it encounters a non-200 status code and retries.
 
     :param monkeypatch: pytest fixture to mock methods.
+    :param caplog: pytest fixture to capture log messages.
     :raise: an assertion error if the method does not handle retries correctly or if the proxies list is not empty after retries.
     """
     mock_responses_list = [
@@ -302,22 +990,19 @@ def test_proxy_rotator_get_proxy_list_retries_and_status_error(monkeypatch):
     )
     monkeypatch.setattr(requests, "get", mock_requests_get)
 
-    captured_output = StringIO()
-    original_stdout = sys.stdout
-    sys.stdout = captured_output
+    caplog.set_level(logging.INFO, logger=github_crawler.__name__)
 
     # Initialize ProxyRotator with proxies=None to trigger get_proxy_list
     rotator = ProxyRotator(proxies=None, get_proxies_retries=2)
 
-    sys.stdout = original_stdout
-    output = captured_output.getvalue()
+    output = caplog.text
 
     assert (
         "Failed to get proxies list from https://free-proxy-list.net/. Status code: 500"
         in output
     )
     assert "Retrying to get proxies list... (1/2)" in output
-    assert rotator.proxies == []
+    assert rotator.proxies == ()
     assert mock_requests_get.call_count == 2
 
 
@@ -336,3 +1021,30 @@ def test_proxy_rotator_get_proxy_list_request_exception(monkeypatch):
 
     with pytest.raises(Exception, match="Couldn't get proxies list."):
         ProxyRotator(proxies=None, get_proxies_retries=1)
+
+
+def test_proxy_rotator_get_proxy_list_cached(monkeypatch):
+    """
+    Test that the get_proxy_list method reuses a fetched proxies list until it expires.
+
+    :param monkeypatch: pytest fixture to mock methods.
+    :raise: an assertion error if the proxies list is fetched again while cached.
+    """
+    mock_requests_get = MagicMock(
+        return_value=MagicMock(
+            status_code=200,
+            text='<html><body><table class="table table-striped table-bordered"><tr><th>IP Address</th><th>Port</th></tr><tr><td>1.2.3.4</td><td>8080</td></tr></table></body></html>',
+        )
+    )
+    monkeypatch.setattr(requests, "get", mock_requests_get)
+
+    first_rotator = ProxyRotator(proxies=None)
+    second_rotator = ProxyRotator(proxies=None)
+
+    assert first_rotator.proxies == second_rotator.proxies == ("http://1.2.3.4:8080",)
+    assert mock_requests_get.call_count == 1
+
+    monkeypatch.setattr(github_crawler, "PROXY_LIST_CACHE_TTL", 0)
+    ProxyRotator(proxies=None)
+
+    assert mock_requests_get.call_count == 2